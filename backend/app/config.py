@@ -51,11 +51,13 @@ UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
 PDF_DIR = os.path.join(UPLOAD_DIR, "pdfs")
 SEGMENTS_DIR = os.path.join(UPLOAD_DIR, "segments")
 IMAGES_DIR = os.path.join(UPLOAD_DIR, "chem_images")
+DOCLING_CACHE_DIR = os.path.join(UPLOAD_DIR, "docling_cache")
 
 # Create directories if they don't exist
 os.makedirs(PDF_DIR, exist_ok=True)
 os.makedirs(SEGMENTS_DIR, exist_ok=True)
 os.makedirs(IMAGES_DIR, exist_ok=True)
+os.makedirs(DOCLING_CACHE_DIR, exist_ok=True)
 
 # Security configuration
 SECRET_KEY = validated_env["SECRET_KEY"]
@@ -1,269 +1,542 @@
+import asyncio
+import hashlib
+import json
 import os
 import re
+import threading
+import uuid
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
 
 from fastapi import HTTPException, status, File, Form, UploadFile
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import (
-    DocumentConverter,
-    PdfFormatOption,
-    ConversionResult,
+from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling_core.types.doc import DoclingDocument
+import fitz
+from app.config import PDF_DIR, DOCLING_CACHE_DIR
+
+# orjson parses cached documents several times faster than the stdlib json module
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick gives a single-pass multi-keyword scan; fall back to regex without it
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Local Docling model directory; when unset Docling uses its own model cache
+artifacts_path = os.environ.get(
+    "DOCLING_ARTIFACTS_PATH", os.environ.get("DOCLING_MODELS_PATH")
 )
-from PyPDF2 import PdfReader, PdfWriter
-from app.config import PDF_DIR
 
-artifacts_path = "/Users/kohulanrajan/.cache/docling/models"
 
-pipeline_options = PdfPipelineOptions(artifacts_path=artifacts_path)
-doc_converter = DocumentConverter(
-    format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-)
+# Shared Docling converter, built on first use under its lock
+_converter = None
+_converter_lock = threading.Lock()
 
 
-def _is_author_line(content: str) -> bool:
+def _get_converter():
     """
-    Check if a line of text appears to be author information.
+    Build the shared Docling converter on first use.
+
+    Model initialization is expensive, so it is deferred until a PDF is actually
+    converted and the converter is then reused across requests. Conversions run
+    in worker threads, so construction is guarded by a lock to load the models
+    only once when the first requests arrive together.
+
+    Returns:
+        DocumentConverter: Converter configured for PDF input
+    """
+    global _converter
+    if _converter is None:
+        with _converter_lock:
+            # Another thread may have built it while this one waited
+            if _converter is None:
+                _converter = _build_converter()
+    return _converter
+
+
+def _build_converter():
+    """Create a Docling converter configured for PDF input."""
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+
+    pipeline_options = PdfPipelineOptions(artifacts_path=artifacts_path)
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
+
+def _keyword_matcher(keywords):
+    """
+    Build a predicate that tells whether a lower-cased text contains any keyword.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so the text
+    is scanned once regardless of the number of keywords; otherwise a compiled
+    regex alternation is used.
 
     Args:
-        content (str): Text content to check
+        keywords (tuple): Lower-case literal keywords to look for
 
     Returns:
-        bool: True if the line appears to be author information
+        Callable[[str], bool]: Predicate taking lower-cased text
     """
-    content_lower = content.lower()
-    content_stripped = content.strip()
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
 
-    # Skip empty or very short content
-    if len(content_stripped) < 3:
-        return False
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    return lambda text: pattern.search(text) is not None
+
+
+# Labels of running headers and footers, which never belong to the paper text
+_PAGE_FURNITURE_LABELS = frozenset({"page_header", "page_footer"})
 
-    # Common patterns in author lines
-    author_patterns = [
+# Chunk size used when streaming uploaded PDFs to disk
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Common patterns in author lines
+_AUTHOR_PATTERNS = [
+    re.compile(p)
+    for p in [
         # Multiple names with commas (typical author list format)
         r"^[A-Z][a-z]+ [A-Z][a-z]+(?:,\s*[A-Z][a-z]+ [A-Z][a-z]+)+",
-        # Names with superscript numbers/letters (affiliation markers)
-        r"[A-Z][a-z]+ [A-Z][a-z]+[¹²³⁴⁵⁶⁷⁸⁹⁰ᵃᵇᶜᵈᵉᶠᵍʰⁱʲᵏˡᵐⁿᵒᵖʳˢᵗᵘᵛʷˣʸᶻ\*†‡§¶]+",
         # Typical affiliation patterns with numbers
         r"^\d+\s*[A-Z][a-z]+ [A-Z][a-z]+",
         # Author names with academic titles
         r"[A-Z][a-z]+\s+[A-Z][a-z]+,?\s*(PhD|Ph\.D\.|MD|Dr\.|Prof\.|Professor)",
     ]
+]
+
+# Nodes longer than this are running prose, never an author or affiliation line
+_PROSE_MIN_LENGTH = 500
+
+# Author/affiliation/table/figure keywords
+_AUTHOR_KEYWORDS = (
+    # Author-specific
+    "corresponding author",
+    "equal contribution",
+    "present address",
+    "current address",
+    "orcid:",
+    "email:",
+    "e-mail:",
+    "tel:",
+    "fax:",
+    "phone:",
+    # Institution patterns
+    "dipartimento",
+    "universita",
+    "università",
+    "university",
+    "institute",
+    "institut",
+    "department",
+    "college",
+    "school of",
+    "faculty of",
+    "laboratory",
+    "lab ",
+    "center for",
+    "centre for",
+    "hospital",
+    "medical center",
+    "research center",
+    # Geographic/Address patterns
+    "via ",
+    "avenue",
+    "street",
+    "road",
+    "blvd",
+    "boulevard",
+    "italy",
+    "genova",
+    "salerno",
+    "bamako",
+    "mali",
+    # Journal/Publication patterns
+    "received",
+    "accepted",
+    "published",
+    "correspondence:",
+    "funding:",
+    "doi:",
+    "copyright",
+    "journal of",
+    "volume",
+    "issue",
+    "page",
+    # Table/Figure patterns
+    "table ",
+    "figure ",
+    "fig ",
+    "chart ",
+    "scheme ",
+    "plate ",
+    "anti-inflammatory activity",
+    "carrageenan-induced",
+    # Chemical compound patterns (often in titles/captions)
+    "compounds 1",
+    "compounds ",
+    "compound ",
+    "structures of",
+    "chemical",
+    "synthesis",
+    "analysis",
+    "characterization",
+    # Author symbols and markers
+    "†",
+    "‡",
+    "§",
+    "¶",
+    "*",
+    "**",
+    "***",
+    # Common institutional suffixes
+    ".it",
+    ".edu",
+    ".org",
+    ".ac.",
+    ".univ",
+)
+_has_author_keyword = _keyword_matcher(_AUTHOR_KEYWORDS)
+
+# Names with superscript numbers/letters (affiliation markers). Every marker is
+# either "*" or non-ASCII, which lets plain ASCII lines skip this regex
+_AUTHOR_MARKER_RE = re.compile(
+    r"[A-Z][a-z]+ [A-Z][a-z]+[¹²³⁴⁵⁶⁷⁸⁹⁰ᵃᵇᶜᵈᵉᶠᵍʰⁱʲᵏˡᵐⁿᵒᵖʳˢᵗᵘᵛʷˣʸᶻ\*†‡§¶]+"
+)
+
+_NONWORD_RE = re.compile(r"[^\w]")
+_WORD_RE = re.compile(r"\w+")
+_SYMBOL_TABLE = str.maketrans("", "", "†‡§¶*,()[]{}0123456789")
+_SYMBOL_MARK_RE = re.compile(r"[†‡§¶\*]{1,3}")
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_POSTAL_RE = re.compile(r"\b\d{4,5}\s+[A-Z][a-z]+")
+
+# Table and figure patterns; captions and numbered data rows anchor at the start
+_TABLE_FIG_PREFIX_RE = re.compile(
+    r"(?:table|figure|fig|chart|scheme|plate)\s+\d+|\d+\s*[a-z]\s+(?:values|assignments)"
+)
+# Pharmacology table captions and footnotes. Each regex is paired with a literal
+# it cannot match without, so the common non-matching line skips the regex
+_TABLE_FIG_PATTERNS = [
+    (anchor, re.compile(p))
+    for anchor, p in [
+        ("edema", r"anti-inflammatory activity.*on.*edema"),
+        ("edema", r"carrageenan-induced.*edema"),
+        ("sem", r"mean.*sem.*n\s*[=\(]"),
+        ("<", r"p\s*<\s*0\."),
+        ("student", r"student.*test"),
+        ("po", r"\bpo\s*,"),
+        ("extraction yield", r"extraction yields?"),
+        ("fractionation yield", r"fractionation yield"),
+    ]
+]
+# Journal metadata keywords
+_JOURNAL_KEYWORDS = (
+    "received",
+    "accepted",
+    "published online",
+    "publication date",
+    "doi:",
+    "issn",
+    "copyright",
+    "journal of",
+    "vol.",
+    "volume",
+    "issue",
+    "pages",
+    "pp.",
+    "manuscript",
+)
+_has_journal_keyword = _keyword_matcher(_JOURNAL_KEYWORDS)
+
+# Obvious metadata that is never part of the paper text
+_METADATA_INDICATORS = (
+    "correspondence:",
+    "received:",
+    "funding:",
+    "doi:",
+    "copyright",
+)
+_has_metadata_indicator = _keyword_matcher(_METADATA_INDICATORS)
+
+# Author, affiliation and metadata indicators that exclude a node from the
+# extracted text
+_AUTHOR_INDICATORS = (
+    "correspondence:",
+    "received:",
+    "funding:",
+    "doi:",
+    "copyright",
+    "@",  # Email addresses
+    "university",
+    "institute",
+    "department",
+    "college",
+    "school of",
+    "faculty of",
+    "laboratory",
+    "lab ",
+    "center for",
+    "centre for",
+    "hospital",
+    "medical center",
+    "research center",
+    "orcid",
+    "author",
+    "affiliation",
+)
+_has_author_indicator = _keyword_matcher(_AUTHOR_INDICATORS)
+# The fallback pass also drops journal issue information
+_ISSUE_INDICATORS = ("journal of", "volume", "issue")
+_has_issue_indicator = _keyword_matcher(_ISSUE_INDICATORS)
+# Journal and publisher names found in running headers
+_PUBLISHER_KEYWORDS = (
+    "phytochemical analysis",
+    "john wiley",
+    "doi.org",
+    "elsevier",
+    "springer",
+)
+_has_publisher_keyword = _keyword_matcher(_PUBLISHER_KEYWORDS)
+
+_COMPOUND_RANGE_RE = re.compile(r"compounds?\s+\d+\s*[-–—]\s*\d+")
+_PAGE_RANGE_RE = re.compile(r"^\d+\s*[-–—]\s*\d+\s*$")
+
+# Section keywords, matched against upper-cased content
+_TITLE_STOPWORDS_RE = re.compile(r"ABSTRACT|INTRODUCTION|EXPERIMENTAL|METHODS|RESULTS")
+_MAIN_SECTION_RE = re.compile(
+    r"METHODS|METHODOLOGY|MATERIALS|EXPERIMENTAL|DISCUSSION|ANALYSIS"
+)
+# Section headers that end the main text
+_SECTION_STOP_RE = re.compile(r"RESULTS|REFERENCES|BIBLIOGRAPHY|ACKNOWLEDGMENT")
+
+# All section keywords, found in one scan by _classify_section_header
+_SECTION_KEYWORD_RE = re.compile(
+    r"ABSTRACT|INTRODUCTION|EXPERIMENTAL|METHODOLOGY|METHODS|MATERIALS"
+    r"|RESULTS|REFERENCES|BIBLIOGRAPHY|ACKNOWLEDGMENT"
+)
+_TITLE_STOPWORDS = frozenset(
+    {"ABSTRACT", "INTRODUCTION", "EXPERIMENTAL", "METHODS", "RESULTS"}
+)
+_ABSTRACT_STOPWORDS = frozenset({"INTRODUCTION", "EXPERIMENTAL", "METHODS", "RESULTS"})
+_METHODS_SECTIONS = frozenset({"METHODOLOGY", "MATERIALS", "EXPERIMENTAL"})
+_END_SECTIONS = frozenset({"RESULTS", "REFERENCES", "BIBLIOGRAPHY", "ACKNOWLEDGMENT"})
+
+# Structured abstract subsection labels
+_STRUCT_ABSTRACT_RE = re.compile(
+    r"Introduction:|Objective:|Methodology:|Results:|Conclusion:"
+    r"|Background:|Methods:|Purpose:|Aim:|Summary:"
+)
+_ABSTRACT_KEYWORDS_RE = re.compile(
+    r"introduction:|objective:|methodology:|results:|conclusion:", re.IGNORECASE
+)
+
+# Main content paragraphs kept by extract_enhanced_paper_content, to avoid too much
+_MAX_MAIN_CONTENT = 8
+
+# Sentences whose SimHash fingerprints differ in at most this many bits are
+# near-duplicate candidates, confirmed word by word with _is_minor_edit.
+# Fingerprints are indexed by _SIMHASH_BANDS bands of 16 bits, so the distance
+# must stay below the number of bands
+_SIMHASH_MAX_DISTANCE = 3
+_SIMHASH_BANDS = 4
+# Each of the 64 fingerprint bits is counted in its own 32-bit lane of one integer
+_SIMHASH_BITS = 64
+_SIMHASH_LANE_WIDTH = 32
+_SIMHASH_LANE_ONES = sum(1 << (_SIMHASH_LANE_WIDTH * i) for i in range(_SIMHASH_BITS))
+_SIMHASH_LANE_TOPS = _SIMHASH_LANE_ONES << (_SIMHASH_LANE_WIDTH - 1)
+_SIMHASH_LANE_MASK = (1 << (_SIMHASH_BITS * _SIMHASH_LANE_WIDTH)) - 1
+_SIMHASH_BAND_WIDTH = _SIMHASH_BITS // _SIMHASH_BANDS * _SIMHASH_LANE_WIDTH
+# Words a near-duplicate may add, drop or swap: short filler such as articles and
+# prepositions, but never numbers or negations, which change a finding
+_MINOR_WORD_MAX_LENGTH = 3
+_NEGATION_WORDS = frozenset({"no", "not", "nor", "non"})
+# Lanes the first word of a pair is rotated by before mixing in the second
+_SIMHASH_PAIR_ROTATION = 7 * _SIMHASH_LANE_WIDTH
+
+# Text cleanup patterns
+# Space before punctuation, or around "|" / "~", handled by _fix_spacing
+_SPACING_RE = re.compile(r"\s+([.,;:?!])|\s*\|\s*|\s*~\s*")
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+# Tokens long enough to be several words glued together by OCR
+_LONG_TOKEN_RE = re.compile(r"\S{21,}")
+# Deletes OCR artifacts in a single C-level pass
+_OCR_TABLE = str.maketrans("", "", "ŒœŸÿ")
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\s+(\w)")
+
+
+def _fix_spacing(match: re.Match) -> str:
+    """Replacement callback for _SPACING_RE."""
+    if match.lastindex:
+        # Drop the whitespace before punctuation
+        return match.group(1)
+    return " | " if "|" in match.group() else " "
+
+
+def _split_joined_words(match: re.Match) -> str:
+    """
+    Replacement callback for _LONG_TOKEN_RE.
+
+    Inserts a space at lower/upper case boundaries. Restricted to long tokens so
+    that legitimate mixed-case terms (pH, NaCl, gene symbols) are left intact.
+    """
+    return _CAMEL_RE.sub(r"\1 \2", match.group())
+
+
+def _is_author_line(content: str, content_lower: Optional[str] = None) -> bool:
+    """
+    Check if a line of text appears to be author information.
+
+    Args:
+        content (str): Text content to check
+        content_lower (str, optional): Lower-cased content, when the caller has it
+
+    Returns:
+        bool: True if the line appears to be author information
+    """
+    content_stripped = content.strip()
+
+    # Skip empty or very short content, and long prose paragraphs
+    if len(content_stripped) < 3 or len(content_stripped) > _PROSE_MIN_LENGTH:
+        return False
+
+    # Affiliation markers and symbols can only occur in non-ASCII text or with
+    # "*"; str.isascii() is a constant-time flag check
+    has_markers = not content.isascii() or "*" in content
 
     # Check for author-like patterns
-    for pattern in author_patterns:
-        if re.search(pattern, content):
+    if has_markers and _AUTHOR_MARKER_RE.search(content):
+        return True
+    for pattern in _AUTHOR_PATTERNS:
+        if pattern.search(content):
             return True
 
     # Check for multiple proper names (likely authors) - more strict
-    words = content.split()
-    if len(words) >= 2 and len(content) < 300:
+    # Only lines shorter than 200 characters can qualify, so skip the scan otherwise
+    if len(content) < 200:
         # Count capitalized words that look like names
-        name_words = []
-        for word in words:
-            # Remove punctuation and check if it's a proper name
-            clean_word = re.sub(r"[^\w]", "", word)
+        name_count = 0
+        for word in content.split():
+            # Remove punctuation (only when present) and check if it's a proper name
+            clean_word = word if word.isalnum() else _NONWORD_RE.sub("", word)
             if (
-                len(clean_word) > 1
+                len(clean_word) > 2
                 and clean_word[0].isupper()
                 and clean_word[1:].islower()
-                and len(clean_word) > 2
             ):
-                name_words.append(clean_word)
-
-        # If we have 3+ name-like words, it's likely an author line
-        if len(name_words) >= 3 and len(content) < 200:
-            return True
-
-    # Check for author/affiliation/table/figure patterns
-    problematic_patterns = [
-        # Author-specific
-        "corresponding author",
-        "equal contribution",
-        "present address",
-        "current address",
-        "orcid:",
-        "email:",
-        "e-mail:",
-        "tel:",
-        "fax:",
-        "phone:",
-        # Institution patterns
-        "dipartimento",
-        "universita",
-        "università",
-        "university",
-        "institute",
-        "institut",
-        "department",
-        "college",
-        "school of",
-        "faculty of",
-        "laboratory",
-        "lab ",
-        "center for",
-        "centre for",
-        "hospital",
-        "medical center",
-        "research center",
-        # Geographic/Address patterns
-        "via ",
-        "avenue",
-        "street",
-        "road",
-        "blvd",
-        "boulevard",
-        "italy",
-        "genova",
-        "salerno",
-        "bamako",
-        "mali",
-        # Journal/Publication patterns
-        "received",
-        "accepted",
-        "published",
-        "correspondence:",
-        "funding:",
-        "doi:",
-        "copyright",
-        "journal of",
-        "volume",
-        "issue",
-        "page",
-        # Table/Figure patterns
-        "table ",
-        "figure ",
-        "fig ",
-        "chart ",
-        "scheme ",
-        "plate ",
-        "anti-inflammatory activity",
-        "carrageenan-induced",
-        # Chemical compound patterns (often in titles/captions)
-        "compounds 1",
-        "compounds ",
-        "compound ",
-        "structures of",
-        "chemical",
-        "synthesis",
-        "analysis",
-        "characterization",
-        # Author symbols and markers
-        "†",
-        "‡",
-        "§",
-        "¶",
-        "*",
-        "**",
-        "***",
-        # Common institutional suffixes
-        ".it",
-        ".edu",
-        ".org",
-        ".ac.",
-        ".univ",
-    ]
+                name_count += 1
+                # If we have 3+ name-like words, it's likely an author line
+                if name_count >= 3:
+                    return True
 
     # Check for problematic content
-    for pattern in problematic_patterns:
-        if pattern in content_lower:
-            return True
+    if content_lower is None:
+        content_lower = content.lower()
+    if _has_author_keyword(content_lower):
+        return True
 
     # Check for lines that are mostly symbols or numbers (affiliations)
-    symbol_count = sum(1 for c in content if c in "†‡§¶*,()[]{}0123456789")
+    symbol_count = len(content) - len(content.translate(_SYMBOL_TABLE))
     if symbol_count > len(content) * 0.3:  # More than 30% symbols
         return True
 
     # Check for lines with unusual punctuation patterns (like affiliation markers)
-    if re.search(r"[†‡§¶\*]{1,3}", content):
+    if has_markers and _SYMBOL_MARK_RE.search(content):
         return True
 
     # Check for email patterns
-    if re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", content):
+    if "@" in content and _EMAIL_RE.search(content):
         return True
 
     # Check for address-like patterns
-    if re.search(r"\b\d{4,5}\s+[A-Z][a-z]+", content):  # Postal codes
+    if _POSTAL_RE.search(content):  # Postal codes
         return True
 
     return False
 
 
-def _is_unwanted_content(content: str) -> bool:
+def _is_unwanted_content(content: str, content_lower: Optional[str] = None) -> bool:
     """
     Check if content should be filtered out (tables, figures, references, etc.)
 
     Args:
         content (str): Text content to check
+        content_lower (str, optional): Lower-cased, stripped content, when the
+            caller has it
 
     Returns:
         bool: True if content should be filtered out
     """
-    content_lower = content.lower().strip()
+    if content_lower is None:
+        content_lower = content.lower().strip()
 
     if len(content_lower) < 3:
         return True
 
     # Table and figure patterns
-    table_fig_patterns = [
-        r"^table\s+\d+",
-        r"^figure\s+\d+",
-        r"^fig\s+\d+",
-        r"^chart\s+\d+",
-        r"^scheme\s+\d+",
-        r"^plate\s+\d+",
-        r"^\d+\s*[a-z]\s+values",
-        r"^\d+\s*[a-z]\s+assignments",
-        r"anti-inflammatory activity.*on.*edema",
-        r"carrageenan-induced.*edema",
-        r"mean.*sem.*n\s*[=\(]",
-        r"p\s*<\s*0\.",
-        r"student.*test",
-        r"\bpo\s*,",
-        r"extraction yields?",
-        r"fractionation yield",
-    ]
-
-    for pattern in table_fig_patterns:
-        if re.search(pattern, content_lower):
+    if _TABLE_FIG_PREFIX_RE.match(content_lower):
+        return True
+    for anchor, pattern in _TABLE_FIG_PATTERNS:
+        if anchor in content_lower and pattern.search(content_lower):
             return True
 
     # Chemical compound lists and structure descriptions
-    if re.search(r"compounds?\s+\d+\s*[-–—]\s*\d+", content_lower):
+    if _COMPOUND_RANGE_RE.search(content_lower):
         return True
 
     # References and citations
-    if re.search(r"^\d+\s*[-–—]\s*\d+\s*$", content_lower):
+    if _PAGE_RANGE_RE.search(content_lower):
         return True
 
     # Journal metadata
-    journal_patterns = [
-        "received",
-        "accepted",
-        "published online",
-        "publication date",
-        "doi:",
-        "issn",
-        "copyright",
-        "journal of",
-        "vol.",
-        "volume",
-        "issue",
-        "pages",
-        "pp.",
-        "manuscript",
-    ]
-
-    for pattern in journal_patterns:
-        if pattern in content_lower:
-            return True
+    if _has_journal_keyword(content_lower):
+        return True
 
     # Very short content that's likely metadata
-    if len(content_lower) < 10 and any(c.isdigit() for c in content_lower):
+    if len(content_lower) < 10 and any(map(str.isdigit, content_lower)):
         return True
 
     return False
 
 
+@lru_cache(maxsize=4096)
+def _should_keep(content: str) -> bool:
+    """
+    Decide whether a text node belongs in the extracted paper text.
+
+    Combines the author indicator, author line and unwanted content checks.
+    Memoized because running headers, footers and affiliations repeat verbatim
+    across pages and documents.
+
+    Args:
+        content (str): Stripped text content to check
+
+    Returns:
+        bool: True if the text should be kept
+    """
+    content_lower = content.lower()
+    return (
+        not _has_author_indicator(content_lower)
+        and not _is_author_line(content, content_lower)
+        and not _is_unwanted_content(content, content_lower)
+    )
+
+
 def extract_first_three_pages(input_pdf_path, number_of_pages=2):
     """
     Extract a specified number of pages from the beginning of a PDF file.
@@ -288,43 +561,89 @@ def extract_first_three_pages(input_pdf_path, number_of_pages=2):
         >>> print(output_path)
         "document_out.pdf"
     """
-    # Open the original PDF
-    with open(input_pdf_path, "rb") as input_pdf_file:
-        pdf_reader = PdfReader(input_pdf_file)
-        pdf_writer = PdfWriter()
+    # Construct the output file path
+    base_name = os.path.splitext(input_pdf_path)[0]
+    output_pdf_file_path = f"{base_name}_out.pdf"
+
+    # Write the pages to a new PDF
+    with open(output_pdf_file_path, "wb") as output_pdf_file:
+        _write_first_pages(input_pdf_path, number_of_pages, output_pdf_file)
+    print(output_pdf_file_path)
+    return output_pdf_file_path
+
+
+def extract_first_pages_stream(input_pdf_path, number_of_pages=2):
+    """
+    Extract a specified number of pages from the beginning of a PDF into memory.
+
+    In-memory counterpart of extract_first_three_pages, used to feed Docling
+    without writing an intermediate PDF to disk.
+
+    Args:
+        input_pdf_path (str): Path to the source PDF file to extract pages from.
+        number_of_pages (int, optional): Number of pages to extract from the beginning. Defaults to 2.
+
+    Returns:
+        DocumentStream: Docling input stream named after the source file.
+    """
+    buffer = BytesIO()
+    _write_first_pages(input_pdf_path, number_of_pages, buffer)
+    buffer.seek(0)
+    return DocumentStream(name=os.path.basename(input_pdf_path), stream=buffer)
 
+
+def _write_first_pages(input_pdf_path, number_of_pages, output_file):
+    """Copy the first N pages of a PDF into a writable binary file object."""
+    # PyMuPDF copies the whole page range in one call
+    with fitz.open(input_pdf_path) as pdf_document, fitz.open() as first_pages:
         # Determine the number of pages to extract
-        num_pages = min(number_of_pages, len(pdf_reader.pages))
+        num_pages = min(number_of_pages, pdf_document.page_count)
+        first_pages.insert_pdf(pdf_document, to_page=num_pages - 1)
+        output_file.write(first_pages.tobytes())
+
+
+def extract_first_pages_pymupdf(input_pdf_path, number_of_pages=2):
+    """
+    Extract plain text from the first pages of a PDF with PyMuPDF.
+
+    Much faster than a Docling conversion, but without any document structure;
+    use it when only the raw text is needed.
 
-        # Add the pages to the writer object
-        for page_num in range(num_pages):
-            page = pdf_reader.pages[page_num]
-            pdf_writer.add_page(page)
+    Args:
+        input_pdf_path (str): Path to the source PDF file.
+        number_of_pages (int, optional): Number of pages to read from the beginning. Defaults to 2.
 
-        # Construct the output file path
-        base_name = os.path.splitext(input_pdf_path)[0]
-        output_pdf_file_path = f"{base_name}_out.pdf"
+    Returns:
+        str: Cleaned text of the first pages as a single line.
 
-        # Write the pages to a new PDF
-        with open(output_pdf_file_path, "wb") as output_pdf_file:
-            pdf_writer.write(output_pdf_file)
-        print(output_pdf_file_path)
-        return output_pdf_file_path
+    Example:
+        >>> text = extract_first_pages_pymupdf("document.pdf", 1)
+        >>> print(text[:50])
+        "A Novel Approach to Chemical Structure Recognition"
+    """
+    with fitz.open(input_pdf_path) as pdf_document:
+        page_count = min(number_of_pages, pdf_document.page_count)
+        text = " ".join(pdf_document[i].get_text("text") for i in range(page_count))
+    return _clean_text(text)
 
 
-def get_converted_document(path, number_of_pages=2):
+def get_converted_document(path, number_of_pages=2, as_dict=True):
     """
     Convert a PDF document to structured JSON format using Docling.
 
     Extracts the first N pages from a PDF and converts them to a structured
-    document format that can be processed for content extraction.
+    document format that can be processed for content extraction. Results are
+    cached by file content, so repeated uploads of the same paper skip Docling.
 
     Args:
         path (str): Path to the PDF file to be converted.
         number_of_pages (int, optional): Number of pages to process. Defaults to 2.
+        as_dict (bool, optional): Export a freshly converted document to a dict.
+            When False, the DoclingDocument is returned as is (cached results are
+            always dicts); the extraction functions accept either. Defaults to True.
 
     Returns:
-        dict: Document structure in JSON format containing text elements,
+        dict | DoclingDocument: Document structure containing text elements,
               layout information, and metadata from the converted PDF.
 
     Raises:
@@ -335,203 +654,248 @@ def get_converted_document(path, number_of_pages=2):
         >>> print(doc_dict.keys())
         dict_keys(['texts', 'schema_name', 'name', ...])
     """
-    output_pdf_file_path = extract_first_three_pages(path, number_of_pages)
-    converter = DocumentConverter()
-    conv_result: ConversionResult = converter.convert(output_pdf_file_path)
-    conv_result_dict = conv_result.document.export_to_dict()
-    return conv_result_dict
+    # Conversion results are cached on disk, keyed by file content and page count
+    cache_path = os.path.join(
+        DOCLING_CACHE_DIR, f"{get_pdf_digest(path)}_{number_of_pages}.json"
+    )
+    if os.path.exists(cache_path):
+        return _load_cached_document(cache_path)
+
+    pdf_stream = extract_first_pages_stream(path, number_of_pages)
+    conv_result = _get_converter().convert(pdf_stream)
+    document = conv_result.document
+
+    # Serialize straight to JSON, and write atomically so concurrent requests
+    # never read a partial file
+    tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write(document.model_dump_json(by_alias=True, exclude_none=True))
+        os.replace(tmp_path, cache_path)
+    finally:
+        # Only left behind when writing or renaming failed
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return document.export_to_dict() if as_dict else document
 
 
-def extract_paper_content(doc_json):
+def get_pdf_digest(path):
     """
-    Extract the title, abstract, and main text up to the results section from a document JSON.
+    Compute the SHA-256 digest of a PDF file.
 
     Args:
-        doc_json (dict): The JSON representation of the document
+        path (str): Path to the PDF file.
 
     Returns:
-        dict: A dictionary containing the title, abstract, and main text
+        str: Hex digest of the file content.
     """
-    title = ""
-    abstract = ""
-    main_text = []
+    hasher = hashlib.sha256()
+    with open(path, "rb") as pdf_file:
+        # Read in chunks to handle large files efficiently
+        for chunk in iter(lambda: pdf_file.read(_UPLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
-    # Get all text elements
-    texts = doc_json.get("texts", [])
 
-    # Find the title (usually the first section_header with level 1, but be more flexible)
-    for text in texts:
-        if text.get("label") == "section_header" and text.get("level") == 1:
-            if (
-                "RESULTS" not in text.get("text", "").upper()
-                and len(text.get("text", "")) > 5  # Reduced from 10 to 5
-            ):
-                title = text.get("text", "")
-                break
-        # Also look for titles without level information
-        elif text.get("label") == "section_header":
-            content = text.get("text", "").strip()
-            if len(content) > 20 and not any(  # Look for substantial headers
-                keyword in content.upper()
-                for keyword in [
-                    "ABSTRACT",
-                    "INTRODUCTION",
-                    "EXPERIMENTAL",
-                    "METHODS",
-                    "RESULTS",
-                ]
-            ):
-                title = content
-                break
+@lru_cache(maxsize=32)
+def _read_cached_document(cache_path):
+    """Read a cached Docling conversion result, keeping recent ones in memory."""
+    with open(cache_path, "rb") as cache_file:
+        return cache_file.read()
 
-    # Find abstract section - look for both standalone "ABSTRACT" headers and inline "ABSTRACT:" text
-    abstract_found = False
-    abstract_section = []
-    collecting_abstract = False
 
-    for i, text in enumerate(texts):
-        content = text.get("text", "").strip()
+def _load_cached_document(cache_path):
+    """Parse a cached Docling conversion result into a fresh dict per call."""
+    # Only the raw bytes are shared between calls, so callers may mutate the result
+    raw = _read_cached_document(cache_path)
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
-        if not content:
-            continue
 
-        # Check for standalone ABSTRACT header
-        if text.get("label") == "section_header" and content.upper() == "ABSTRACT":
-            collecting_abstract = True
-            abstract_found = True
-            continue
+def iter_texts(doc):
+    """
+    Iterate over the text items of a Docling document.
 
-        # Check for inline ABSTRACT: format
-        if "ABSTRACT:" in content.upper():
-            abstract_section.append(
-                content.replace("ABSTRACT:", "").replace("Abstract:", "").strip()
-            )
-            abstract_found = True
-            collecting_abstract = True
-            continue
+    Dict documents come from exported or cached JSON; DoclingDocument items are
+    read through attribute access, so a fresh conversion is never exported to a
+    dict. Items are yielded lazily, so callers that stop early never touch the rest.
 
-        # If we're collecting abstract content
-        if collecting_abstract:
-            # Stop at next section header (like "1 | Introduction")
-            if text.get("label") == "section_header" and any(
-                section in content.upper()
-                for section in ["INTRODUCTION", "EXPERIMENTAL", "METHODS", "RESULTS"]
-            ):
-                break
-            # Skip page headers/footers but be more inclusive
-            if text.get("label") not in ["page_header", "page_footer"]:
-                # Only skip obvious metadata
-                if not any(
-                    indicator in content.lower()
-                    for indicator in [
-                        "correspondence:",
-                        "received:",
-                        "funding:",
-                        "doi:",
-                        "copyright",
-                    ]
-                ):
-                    abstract_section.append(content)
+    Args:
+        doc (dict | DoclingDocument): The Docling document
 
-    abstract = " ".join(abstract_section)
+    Yields:
+        tuple: (label, text, page_no, item), with page_no None for items without
+            provenance and item being the raw text item for reading optional
+            attributes. Callers treat a missing page as page 1, but never stop
+            scanning on it, since such items can appear anywhere in the list
+    """
+    if isinstance(doc, dict):
+        for item in doc.get("texts", []):
+            prov = item.get("prov")
+            page_no = prov[0].get("page_no", 1) if prov else None
+            yield item.get("label"), item.get("text", ""), page_no, item
+    else:
+        for item in doc.texts:
+            prov = item.prov
+            yield item.label, item.text, prov[0].page_no if prov else None, item
 
-    # Extract main text including introduction and up to results section (more comprehensive)
-    found_intro = False
-    main_text = []
 
-    for text in texts:
-        content = text.get("text", "").strip()
-        page_no = text.get("prov", [{}])[0].get("page_no", 1) if text.get("prov") else 1
+def _text_attr(text, name, default=None):
+    """Read an optional attribute of a Docling text item given as a dict or model."""
+    if isinstance(text, dict):
+        return text.get(name, default)
+    return getattr(text, name, default)
+
 
-        # Skip empty content and page headers/footers
-        if not content or text.get("label") in ["page_header", "page_footer"]:
+def _classify_section_header(upper):
+    """
+    Classify an upper-cased section header with a single keyword scan.
+
+    Args:
+        upper (str): Upper-cased header text
+
+    Returns:
+        tuple: (kind, keywords) where kind is one of "ABSTRACT", "INTRODUCTION",
+            "METHODS", "END" or "OTHER", and keywords is the frozenset of section
+            keywords found in the header
+    """
+    keywords = frozenset(_SECTION_KEYWORD_RE.findall(upper))
+    if upper == "ABSTRACT":
+        kind = "ABSTRACT"
+    elif "INTRODUCTION" in keywords:
+        kind = "INTRODUCTION"
+    elif not keywords.isdisjoint(_METHODS_SECTIONS):
+        kind = "METHODS"
+    elif not keywords.isdisjoint(_END_SECTIONS):
+        kind = "END"
+    else:
+        kind = "OTHER"
+    return kind, keywords
+
+
+def extract_paper_content(doc_json, max_page_no=6):
+    """
+    Extract the title, abstract, and main text up to the results section from a document JSON.
+
+    The text elements are scanned once; title, abstract and main text are
+    tracked as independent states and the scan stops as soon as all of them
+    are settled.
+
+    Args:
+        doc_json (dict): The JSON representation of the document
+        max_page_no (int, optional): Last page to read; text on later pages is
+            skipped before any classification. Defaults to 6.
+
+    Returns:
+        dict: A dictionary containing the title, abstract, and main text
+    """
+    title = ""
+    abstract_section = []
+    main_text = []
+    # Early-page content used when neither abstract nor main text is found
+    fallback_text = []
+
+    title_done = False
+    collecting_abstract = False
+    abstract_done = False
+    found_intro = False
+    main_done = False
+    need_fallback = True
+
+    for label, raw_content, page_no, text in iter_texts(doc_json):
+        # Later pages never contribute, so drop them before any classification
+        if page_no is None:
+            page_no = 1
+        elif page_no > max_page_no:
             continue
 
-        # Look for introduction section header (like "1 | Introduction" or "Introduction")
-        if text.get("label") == "section_header" and (
-            "INTRODUCTION" in content.upper()
-            or ("|" in content and "INTRODUCTION" in content.upper())
-        ):
-            found_intro = True
-            # Include the introduction header itself
-            main_text.append(content)
+        content = raw_content.strip()
+        upper = content.upper()
+        # Section headers are classified once; every other node is plain text
+        if label == "section_header":
+            kind, keywords = _classify_section_header(upper)
+        else:
+            kind, keywords = "TEXT", frozenset()
+
+        # Find the title (usually the first section_header with level 1, but be more flexible)
+        if not title_done and kind != "TEXT":
+            if _text_attr(text, "level") == 1:
+                if "RESULTS" not in keywords and len(raw_content) > 5:
+                    title = raw_content
+                    title_done = True
+            # Also look for substantial titles without level information
+            elif len(content) > 20 and keywords.isdisjoint(_TITLE_STOPWORDS):
+                title = content
+                title_done = True
+
+        if not content:
             continue
 
-        # Also look for methodology/materials sections as valid content
-        if text.get("label") == "section_header" and any(
-            section in content.upper()
-            for section in ["METHODOLOGY", "MATERIALS", "EXPERIMENTAL"]
+        is_page_furniture = label in _PAGE_FURNITURE_LABELS
+        is_metadata = _has_metadata_indicator(content.lower())
+
+        # Find abstract section - look for both standalone "ABSTRACT" headers and inline "ABSTRACT:" text
+        if not abstract_done:
+            match kind:
+                # Standalone ABSTRACT header
+                case "ABSTRACT":
+                    collecting_abstract = True
+                # Inline ABSTRACT: format
+                case _ if "ABSTRACT:" in upper:
+                    abstract_section.append(
+                        content.replace("ABSTRACT:", "")
+                        .replace("Abstract:", "")
+                        .strip()
+                    )
+                    collecting_abstract = True
+                # Stop at next section header (like "1 | Introduction")
+                case _ if collecting_abstract and not keywords.isdisjoint(
+                    _ABSTRACT_STOPWORDS
+                ):
+                    abstract_done = True
+                # Collect, skipping page headers/footers and obvious metadata
+                case _ if collecting_abstract and not (
+                    is_page_furniture or is_metadata
+                ):
+                    abstract_section.append(content)
+
+        # Extract main text including introduction and up to results section
+        if not main_done and not is_page_furniture:
+            match kind:
+                # Introduction header (like "1 | Introduction"), or a
+                # methodology/materials section if we haven't found one
+                case "INTRODUCTION" | "METHODS":
+                    found_intro = True
+                    # Include the section header itself
+                    main_text.append(content)
+                # Stop at results or references section
+                case "END" if found_intro:
+                    main_done = True
+                # Collect main text after introduction
+                case _ if found_intro and not is_metadata:
+                    main_text.append(content)
+
+        # Collect early-page content for the fallback (first 3 pages only)
+        if (
+            need_fallback
+            and not is_page_furniture
+            and len(content) >= 5
+            and page_no <= 3
+            and not is_metadata
         ):
-            found_intro = True  # Start collecting from here if we haven't found intro
-            main_text.append(content)
-            continue
+            fallback_text.append(content)
 
-        # Stop at results or references section
-        if found_intro and text.get("label") == "section_header":
-            if any(
-                section in content.upper()
-                for section in [
-                    "RESULTS",
-                    "REFERENCES",
-                    "BIBLIOGRAPHY",
-                    "ACKNOWLEDGMENT",
-                ]
-            ):
+        if title_done and abstract_done and main_done:
+            # Nothing else can change; the fallback is only needed when both are empty
+            need_fallback = not main_text and not " ".join(abstract_section)
+            if not need_fallback:
                 break
 
-        # Collect main text after introduction (be more inclusive)
-        if (
-            found_intro and page_no <= 6
-        ):  # Limit to first 6 pages to avoid too much content
-            # Only skip obvious metadata
-            if not any(
-                indicator in content.lower()
-                for indicator in [
-                    "correspondence:",
-                    "received:",
-                    "funding:",
-                    "doi:",
-                    "copyright",
-                ]
-            ):
-                main_text.append(content)
+    abstract = " ".join(abstract_section)
 
     # Enhanced fallback: if we didn't get much content, be more aggressive
     if not abstract and not main_text:
-        # Get more content from early pages
-        for text in texts:
-            content = text.get("text", "").strip()
-            page_no = (
-                text.get("prov", [{}])[0].get("page_no", 1) if text.get("prov") else 1
-            )
-
-            # Skip page headers/footers and very short content
-            if (
-                not content
-                or text.get("label") in ["page_header", "page_footer"]
-                or len(content) < 5
-            ):
-                continue
-
-            # Only process first 3 pages for fallback
-            if page_no > 3:
-                continue
-
-            # Only skip obvious metadata
-            if any(
-                indicator in content.lower()
-                for indicator in [
-                    "correspondence:",
-                    "received:",
-                    "funding:",
-                    "doi:",
-                    "copyright",
-                ]
-            ):
-                continue
-
-            # Add to main_text
-            main_text.append(content)
+        main_text = fallback_text
 
     # Join the main text paragraphs
     main_text_str = " ".join(main_text)
@@ -562,7 +926,9 @@ def extract_from_docling_document(data):
         "A Novel Approach to Chemical Structure Recognition"
     """
     # For Docling format, we need to extract the main document structure
-    if "schema_name" in data and data["schema_name"] == "DoclingDocument":
+    if isinstance(data, DoclingDocument) or (
+        "schema_name" in data and data["schema_name"] == "DoclingDocument"
+    ):
         result = extract_paper_content(data)
 
         # Check if any of the key components are empty and extract additional info if needed
@@ -572,34 +938,23 @@ def extract_from_docling_document(data):
             or not result.get("main_text")
         ):
             # Try to extract more text based on document structure
-            texts = data.get("texts", [])
-
             # If title is empty, try to find a likely title
             if not result.get("title"):
-                for text in texts:
-                    content = text.get("text", "").strip()
+                for label, raw_content, _, text in iter_texts(data):
+                    content = raw_content.strip()
                     # Look for section headers that could be titles (longer than typical headers)
                     if (
-                        text.get("label") == "section_header"
+                        label == "section_header"
                         and len(content) > 30
-                        and not any(
-                            keyword in content.upper()
-                            for keyword in [
-                                "ABSTRACT",
-                                "INTRODUCTION",
-                                "RESULTS",
-                                "METHODS",
-                                "EXPERIMENTAL",
-                            ]
-                        )
+                        and not _TITLE_STOPWORDS_RE.search(content.upper())
                     ):
                         result["title"] = content
                         break
                     # Look for large font text at the beginning
                     elif (
-                        text.get("label") == "paragraph"
-                        and text.get("page_number") == 1
-                        and text.get("font_size", 0) > 12
+                        label == "paragraph"
+                        and _text_attr(text, "page_number") == 1
+                        and _text_attr(text, "font_size", 0) > 12
                     ):
                         result["title"] = content
                         break
@@ -608,27 +963,15 @@ def extract_from_docling_document(data):
             if not result.get("abstract"):
                 # Try to find abstract section by looking for structured content
                 abstract_texts = []
-                for i, text in enumerate(texts):
-                    content = text.get("text", "").strip()
+                for label, raw_content, _, _ in iter_texts(data):
+                    content = raw_content.strip()
 
                     # Look for abstract-related content
-                    if any(
-                        keyword in content.lower()
-                        for keyword in [
-                            "introduction:",
-                            "objective:",
-                            "methodology:",
-                            "results:",
-                            "conclusion:",
-                        ]
-                    ):
+                    if _ABSTRACT_KEYWORDS_RE.search(content):
                         abstract_texts.append(content)
 
                     # If we find "introduction" header, stop collecting
-                    if (
-                        text.get("label") == "section_header"
-                        and "introduction" in content.lower()
-                    ):
+                    if label == "section_header" and "introduction" in content.lower():
                         break
 
                 if abstract_texts:
@@ -680,30 +1023,269 @@ def combine_to_paragraph(result_dict):
     if main_text:
         combined_text.append(main_text)
 
-    # Join with spaces and clean up formatting
-    combined_paragraph = " ".join(combined_text)
-
-    # Clean up the text formatting
-    # Replace newlines with spaces
-    combined_paragraph = combined_paragraph.replace("\n", " ")
-    # Replace multiple spaces with single spaces
-    combined_paragraph = re.sub(r"\s+", " ", combined_paragraph)
-    # Fix spacing around punctuation
-    combined_paragraph = re.sub(r"\s+([.,;:?!])", r"\1", combined_paragraph)
-    # Remove extra spaces around common symbols
-    combined_paragraph = re.sub(r"\s*\|\s*", " | ", combined_paragraph)
-    combined_paragraph = re.sub(r"\s*~\s*", " ", combined_paragraph)
-    # Clean up common formatting issues
-    combined_paragraph = re.sub(r"([a-z])([A-Z])", r"\1 \2", combined_paragraph)
-    # Remove unnecessary symbols that might have been OCR artifacts
-    combined_paragraph = re.sub(r"[ŒœŸÿ]", "", combined_paragraph)
+    # Join with spaces and clean up the text formatting, also splitting words
+    # that OCR glued together
+    return _clean_text(" ".join(combined_text), split_joined_words=True)
+
+
+def _iter_sentences(text):
+    """
+    Lazily yield the pieces of a text between ". " separators.
+
+    Equivalent to text.split(". ") without building the full list up front.
+
+    Args:
+        text (str): Text to split
+
+    Yields:
+        str: Each sentence, without its separator
+    """
+    start = 0
+    while True:
+        end = text.find(". ", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 2
+
+
+@lru_cache(maxsize=8192)
+def _token_vector(token):
+    """
+    Spread a stable hash of a word over the SimHash lanes, one bit per lane.
+
+    Args:
+        token (str): Word of a sentence
+
+    Returns:
+        int: Integer with the low bit of each 32-bit lane set or cleared
+    """
+    # blake2b rather than hash() so fingerprints do not change between processes;
+    # the low bit of each of its 64 digest bytes becomes one lane
+    lanes = bytearray(_SIMHASH_BITS * _SIMHASH_LANE_WIDTH // 8)
+    lanes[:: _SIMHASH_LANE_WIDTH // 8] = hashlib.blake2b(token.encode()).digest()
+    return int.from_bytes(lanes, "little") & _SIMHASH_LANE_ONES
+
+
+def _simhash(tokens):
+    """
+    Compute a 64-bit SimHash fingerprint of a token sequence.
+
+    Each bit is set when the majority of feature hashes have it set, so sentences
+    sharing nearly all of their words get fingerprints only a few bits apart.
+    Features are the words plus each pair of adjacent words, so sentences that
+    only swap words around ("A inhibits B" / "B inhibits A") stay apart.
+
+    Votes are counted for all bits at once: each bit has its own 32-bit lane in
+    one integer, so adding the feature vectors sums every lane.
+
+    Args:
+        tokens (list): Words of the sentence
+
+    Returns:
+        int: Fingerprint with its 64 bits at the top bit of each lane; compare
+            fingerprints with (a ^ b).bit_count()
+    """
+    vectors = [_token_vector(token) for token in tokens]
+    # A word pair is the first word's vector rotated by a few lanes XOR the second
+    rotation = _SIMHASH_PAIR_ROTATION
+    width = _SIMHASH_BITS * _SIMHASH_LANE_WIDTH
+    vectors += [
+        (((first << rotation) | (first >> (width - rotation))) & _SIMHASH_LANE_MASK)
+        ^ second
+        for first, second in zip(vectors, vectors[1:])
+    ]
+    # Bias every lane so that more than len(vectors) // 2 votes carry into its top bit
+    bias = (1 << (_SIMHASH_LANE_WIDTH - 1)) - 1 - len(vectors) // 2
+    return (sum(vectors) + bias * _SIMHASH_LANE_ONES) & _SIMHASH_LANE_TOPS
+
+
+def _is_minor_word(word):
+    """Check if a word is filler that a near-duplicate sentence may differ by."""
+    return (
+        len(word) <= _MINOR_WORD_MAX_LENGTH
+        and word not in _NEGATION_WORDS
+        and not any(map(str.isdigit, word))
+    )
+
+
+def _is_minor_edit(words, other):
+    """
+    Check if two word lists differ by at most one filler word.
+
+    The lists must be equal after adding, dropping or replacing a single word,
+    and every word involved must pass _is_minor_word.
+
+    Args:
+        words (list): Words of one sentence
+        other (list): Words of the other sentence
+
+    Returns:
+        bool: True if the sentences are near-duplicates
+    """
+    if len(words) < len(other):
+        words, other = other, words
+    if len(words) - len(other) > 1:
+        return False
+    # Position of the first differing word; everything after it must line up
+    index = next(
+        (
+            i
+            for i, (word, other_word) in enumerate(zip(words, other))
+            if word != other_word
+        ),
+        len(other),
+    )
+    if len(words) == len(other):
+        if index == len(words):
+            return True
+        changed = (words[index], other[index])
+        rest_equal = words[index + 1 :] == other[index + 1 :]
+    else:
+        changed = (words[index],)
+        rest_equal = words[index + 1 :] == other[index:]
+    return rest_equal and all(map(_is_minor_word, changed))
+
+
+def _unique_sentences(text):
+    """
+    Split text into sentences, dropping repeats and near-duplicates.
+
+    Sentences are compared by their lower-cased words, ignoring punctuation and
+    whitespace; exact repeats are caught by a set lookup. Near-duplicates must
+    have SimHash fingerprints at most _SIMHASH_MAX_DISTANCE bits apart and
+    differ by a single filler word (see _is_minor_edit), so sentences that
+    change a number, a negation or a name are always kept. Candidates are found
+    through an index on the four 16-bit bands of each fingerprint: two
+    fingerprints within 3 bits of each other must agree on at least one band,
+    so only sentences sharing a band are compared.
+    Sentences of 10 characters or fewer are dropped.
+
+    Args:
+        text (str): Combined text
+
+    Returns:
+        list: Sentences kept, in their original order and form
+    """
+    unique_sentences = []
+    seen_sentences = set()
+    band_index = [{} for _ in range(_SIMHASH_BANDS)]
+
+    for sentence in _iter_sentences(text):
+        sentence_clean = sentence.strip().lower()
+        if len(sentence_clean) <= 10:
+            continue
+        words = _WORD_RE.findall(sentence_clean)
+        normalized = " ".join(words)
+        if normalized in seen_sentences:
+            continue
+        seen_sentences.add(normalized)
+
+        fingerprint = _simhash(words)
+        bands = [
+            (fingerprint >> (_SIMHASH_BAND_WIDTH * band))
+            & ((1 << _SIMHASH_BAND_WIDTH) - 1)
+            for band in range(_SIMHASH_BANDS)
+        ]
+        if any(
+            (fingerprint ^ seen).bit_count() <= _SIMHASH_MAX_DISTANCE
+            and _is_minor_edit(words, seen_words)
+            for index, band in zip(band_index, bands)
+            for seen, seen_words in index.get(band, ())
+        ):
+            continue
+
+        unique_sentences.append(sentence)
+        for index, band in zip(band_index, bands):
+            index.setdefault(band, []).append((fingerprint, words))
+
+    return unique_sentences
+
+
+def _clean_text(text, split_joined_words=False):
+    """
+    Normalize whitespace, punctuation spacing and OCR artifacts in extracted text.
+
+    Runs as a few fused passes: one str.translate/split that drops OCR artifacts
+    and collapses newlines, tabs and runs of whitespace, one regex pass for
+    spacing around punctuation, and one for hyphenated line breaks.
+
+    Args:
+        text (str): Raw joined text
+        split_joined_words (bool, optional): Also split words that OCR glued
+            together. Defaults to False.
+
+    Returns:
+        str: Cleaned single-line text
+    """
+    text = " ".join(text.translate(_OCR_TABLE).split())
+    # Fix spacing around punctuation and common symbols in one pass
+    text = _SPACING_RE.sub(_fix_spacing, text)
+    if split_joined_words:
+        # Only implausibly long tokens are considered
+        text = _LONG_TOKEN_RE.sub(_split_joined_words, text)
     # Fix common word breaks
-    combined_paragraph = re.sub(r"(\w)-\s+(\w)", r"\1\2", combined_paragraph)
+    text = _HYPHEN_BREAK_RE.sub(r"\1\2", text)
+    return " ".join(text.split())
+
+
+async def save_upload_file(upload_file: UploadFile, file_path: str) -> None:
+    """
+    Stream an uploaded file to disk in fixed-size chunks.
+
+    Blocking file operations run in a worker thread, so writing a large upload
+    never stalls the event loop.
+
+    Args:
+        upload_file (UploadFile): The uploaded file to save.
+        file_path (str): Destination path on disk.
+    """
+    buffer = await asyncio.to_thread(open, file_path, "wb")
+    try:
+        while chunk := await upload_file.read(_UPLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(buffer.write, chunk)
+    finally:
+        await asyncio.to_thread(buffer.close)
 
-    # Final cleanup - ensure single spaces
-    combined_paragraph = re.sub(r"\s+", " ", combined_paragraph).strip()
 
-    return combined_paragraph
+def _extract_pdf_text(file_path, pages):
+    """
+    Convert a PDF and extract its combined paper text.
+
+    Falls back to full page extraction if content is insufficient, and to the
+    enhanced extraction for structured papers.
+
+    Args:
+        file_path (str): Path to the PDF file
+        pages (int): Number of pages to process from the beginning
+
+    Returns:
+        str: Combined extracted text content
+    """
+    json_data = get_converted_document(file_path, number_of_pages=pages, as_dict=False)
+    result = extract_from_docling_document(json_data)
+    combined_text = combine_to_paragraph(result)
+
+    # Check if the extracted text has more than 10 words
+    if len(combined_text.split()) <= 10:
+        # If extracted text has 10 or fewer words, extract the whole first page
+        all_text = extract_full_page_text(json_data)
+        if all_text:
+            combined_text = all_text
+
+    # Additional check: if combined text is still too short or doesn't contain substantial content
+    elif (
+        len(combined_text.split()) < 100
+        or "introduction" not in combined_text.lower()
+        or "phytochemical analysis" in combined_text.lower()
+    ):
+        # Try a more aggressive extraction approach for structured papers
+        enhanced_text = extract_enhanced_paper_content(json_data)
+        if enhanced_text and len(enhanced_text.split()) > len(combined_text.split()):
+            combined_text = enhanced_text
+
+    return combined_text
 
 
 async def extract_pdf_text(
@@ -755,34 +1337,11 @@ async def extract_pdf_text(
             pass
         else:
             # Save the uploaded file with original name
-            with open(file_path, "wb") as buffer:
-                content = await pdf_file.read()
-                buffer.write(content)
-
-        # Process the PDF file
-        json_data = get_converted_document(file_path, number_of_pages=pages)
-        result = extract_from_docling_document(json_data)
-        combined_text = combine_to_paragraph(result)
-
-        # Check if the extracted text has more than 10 words
-        if len(combined_text.split()) <= 10:
-            # If extracted text has 10 or fewer words, extract the whole first page
-            all_text = extract_full_page_text(json_data)
-            if all_text:
-                combined_text = all_text
-
-        # Additional check: if combined text is still too short or doesn't contain substantial content
-        elif (
-            len(combined_text.split()) < 100
-            or "introduction" not in combined_text.lower()
-            or "phytochemical analysis" in combined_text.lower()
-        ):
-            # Try a more aggressive extraction approach for structured papers
-            enhanced_text = extract_enhanced_paper_content(json_data)
-            if enhanced_text and len(enhanced_text.split()) > len(
-                combined_text.split()
-            ):
-                combined_text = enhanced_text
+            await save_upload_file(pdf_file, file_path)
+
+        # Convert and extract in a worker thread; both are CPU-bound and would
+        # otherwise block the event loop for every other request
+        combined_text = await asyncio.to_thread(_extract_pdf_text, file_path, pages)
 
         return {"text": combined_text, "pdf_filename": safe_filename}
 
@@ -806,24 +1365,15 @@ def extract_enhanced_paper_content(doc_json):
     Returns:
         str: Enhanced extracted text content or empty string if extraction fails
     """
-    texts = doc_json.get("texts", [])
     extracted_content = []
 
     # Look for title - longest section header that's not a common section
     title = ""
-    for text in texts:
-        if text.get("label") == "section_header":
-            content = text.get("text", "").strip()
-            if len(content) > 20 and not any(  # Reduced from 30 to 20
-                keyword in content.upper()
-                for keyword in [
-                    "ABSTRACT",
-                    "INTRODUCTION",
-                    "EXPERIMENTAL",
-                    "METHODS",
-                    "RESULTS",
-                ]
-            ):
+    for label, raw_content, _, _ in iter_texts(doc_json):
+        if label == "section_header":
+            content = raw_content.strip()
+            # Reduced minimum length from 30 to 20
+            if len(content) > 20 and not _TITLE_STOPWORDS_RE.search(content.upper()):
                 title = content
                 break
 
@@ -838,187 +1388,81 @@ def extract_enhanced_paper_content(doc_json):
     capturing_introduction = False
     capturing_main = False
 
-    for i, text in enumerate(texts):
-        content = text.get("text", "").strip()
-        page_no = text.get("prov", [{}])[0].get("page_no", 1) if text.get("prov") else 1
+    for label, raw_content, page_no, _ in iter_texts(doc_json):
+        # Texts are in page order; past page 6 every bucket is over its page
+        # limit, and only a structured abstract still being read can grow.
+        # Items without provenance count as page 1 and may follow later pages,
+        # so skip instead of stopping
+        if page_no is None:
+            page_no = 1
+        elif page_no > 6 and not capturing_abstract:
+            continue
+
+        content = raw_content.strip()
 
         # Skip empty content and headers/footers, but be more lenient
         if (
             not content
-            or text.get("label") in ["page_header", "page_footer"]
+            or label in _PAGE_FURNITURE_LABELS
             or len(content) < 3  # Reduced from 5 to 3
         ):
             continue
 
-        # Check for abstract section
-        if text.get("label") == "section_header" and content.upper() == "ABSTRACT":
-            capturing_abstract = True
-            continue
+        # Only section headers are matched against section names, so only they
+        # are upper-cased
+        is_section_header = label == "section_header"
+        if is_section_header:
+            upper = content.upper()
+
+            # Check for abstract section
+            if upper == "ABSTRACT":
+                capturing_abstract = True
+                continue
 
         # Check for structured abstract content (Introduction:, Objective:, etc.)
-        if capturing_abstract and any(
-            keyword in content
-            for keyword in [
-                "Introduction:",
-                "Objective:",
-                "Methodology:",
-                "Results:",
-                "Conclusion:",
-                "Background:",
-                "Methods:",
-                "Purpose:",
-                "Aim:",
-                "Summary:",
-            ]
-        ):
+        if capturing_abstract and _STRUCT_ABSTRACT_RE.search(content):
             abstract_content.append(content)
             continue
 
-        # Check for main introduction section
-        if text.get("label") == "section_header" and (
-            "INTRODUCTION" in content.upper()
-            or ("|" in content and "INTRODUCTION" in content.upper())
-        ):
-            capturing_abstract = False  # Stop capturing abstract
-            capturing_introduction = True
-            continue
+        if is_section_header:
+            # Check for main introduction section
+            if "INTRODUCTION" in upper:
+                capturing_abstract = False  # Stop capturing abstract
+                capturing_introduction = True
+                continue
 
-        # Check for main content sections
-        if text.get("label") == "section_header" and any(
-            section in content.upper()
-            for section in [
-                "METHODS",
-                "METHODOLOGY",
-                "MATERIALS",
-                "EXPERIMENTAL",
-                "DISCUSSION",
-                "ANALYSIS",
-            ]
-        ):
-            capturing_introduction = False
-            capturing_main = True
-            continue
+            # Check for main content sections
+            if _MAIN_SECTION_RE.search(upper):
+                capturing_introduction = False
+                capturing_main = True
+                continue
 
-        # Stop main capture at results or references
-        if capturing_main and text.get("label") == "section_header":
-            if any(
-                section in content.upper()
-                for section in [
-                    "RESULTS",
-                    "REFERENCES",
-                    "BIBLIOGRAPHY",
-                    "ACKNOWLEDGMENT",
-                ]
-            ):
+            # Stop main capture at results or references
+            if capturing_main and _SECTION_STOP_RE.search(upper):
                 capturing_main = False
 
-        # Capture abstract content (more lenient but filter out author info and unwanted content)
-        if capturing_abstract and page_no <= 3:  # Increased from 2 to 3
-            # Enhanced filtering to exclude author names, affiliations, and unwanted content
-            if (
-                not any(
-                    indicator in content.lower()
-                    for indicator in [
-                        "correspondence:",
-                        "received:",
-                        "funding:",
-                        "doi:",
-                        "copyright",
-                        "@",  # Email addresses
-                        "university",
-                        "institute",
-                        "department",
-                        "college",
-                        "school of",
-                        "faculty of",
-                        "laboratory",
-                        "lab ",
-                        "center for",
-                        "centre for",
-                        "hospital",
-                        "medical center",
-                        "research center",
-                        "orcid",
-                        "author",
-                        "affiliation",
-                    ]
-                )
-                and not _is_author_line(content)
-                and not _is_unwanted_content(content)
-            ):
-                abstract_content.append(content)
-
-        # Capture introduction content (more pages but with comprehensive filtering)
-        if capturing_introduction and page_no <= 5:  # Increased from 3 to 5
-            # Filter out author information and unwanted content
-            if (
-                not any(
-                    indicator in content.lower()
-                    for indicator in [
-                        "correspondence:",
-                        "received:",
-                        "funding:",
-                        "doi:",
-                        "copyright",
-                        "@",  # Email addresses
-                        "university",
-                        "institute",
-                        "department",
-                        "college",
-                        "school of",
-                        "faculty of",
-                        "laboratory",
-                        "lab ",
-                        "center for",
-                        "centre for",
-                        "hospital",
-                        "medical center",
-                        "research center",
-                        "orcid",
-                        "author",
-                        "affiliation",
-                    ]
-                )
-                and not _is_author_line(content)
-                and not _is_unwanted_content(content)
-            ):
-                introduction_content.append(content)
-
-        # Capture main content with comprehensive filtering
-        if capturing_main and page_no <= 6:
-            # Filter out author information and unwanted content
-            if (
-                not any(
-                    indicator in content.lower()
-                    for indicator in [
-                        "correspondence:",
-                        "received:",
-                        "funding:",
-                        "doi:",
-                        "copyright",
-                        "@",  # Email addresses
-                        "university",
-                        "institute",
-                        "department",
-                        "college",
-                        "school of",
-                        "faculty of",
-                        "laboratory",
-                        "lab ",
-                        "center for",
-                        "centre for",
-                        "hospital",
-                        "medical center",
-                        "research center",
-                        "orcid",
-                        "author",
-                        "affiliation",
-                    ]
-                )
-                and not _is_author_line(content)
-                and not _is_unwanted_content(content)
-            ):
-                main_content.append(content)
+        # Route the node to every section being captured, each with its own
+        # page limit: abstract 3 (increased from 2), introduction 5 (increased
+        # from 3) and main content 6. Main content is capped at insertion so a
+        # full bucket no longer costs any filtering
+        targets = [
+            bucket
+            for capturing, max_page_no, bucket in (
+                (capturing_abstract, 3, abstract_content),
+                (capturing_introduction, 5, introduction_content),
+                (
+                    capturing_main and len(main_content) < _MAX_MAIN_CONTENT,
+                    6,
+                    main_content,
+                ),
+            )
+            if capturing and page_no <= max_page_no
+        ]
+        # Filter out author names, affiliations and unwanted content once,
+        # whichever sections receive the node
+        if targets and _should_keep(content):
+            for bucket in targets:
+                bucket.append(content)
 
     # Combine all content
     if title:
@@ -1028,9 +1472,7 @@ def extract_enhanced_paper_content(doc_json):
     if introduction_content:
         extracted_content.extend(introduction_content)
     if main_content:
-        extracted_content.extend(
-            main_content[:8]
-        )  # Limit main content to avoid too much
+        extracted_content.extend(main_content)
 
     # Remove duplicate title if it appears again in the content
     if title and len(extracted_content) > 1:
@@ -1039,9 +1481,10 @@ def extract_enhanced_paper_content(doc_json):
         filtered_content = [title]  # Keep the original title
 
         for content_piece in extracted_content[1:]:  # Skip the first title
-            content_words = set(content_piece.lower().split())
+            # Intersect straight from the word list; no set is built for the piece
+            shared_words = title_words.intersection(content_piece.lower().split())
             # If more than 70% of words match the title, skip it
-            if len(title_words & content_words) / max(len(title_words), 1) < 0.7:
+            if len(shared_words) / max(len(title_words), 1) < 0.7:
                 filtered_content.append(content_piece)
 
         extracted_content = filtered_content
@@ -1052,74 +1495,33 @@ def extract_enhanced_paper_content(doc_json):
         if title:
             extracted_content.append(title)
 
-        for text in texts:
-            content = text.get("text", "").strip()
-            page_no = (
-                text.get("prov", [{}])[0].get("page_no", 1) if text.get("prov") else 1
-            )
+        for label, raw_content, page_no, _ in iter_texts(doc_json):
 
-            # Process first 4 pages instead of 2
-            if page_no > 4:
+            # Process first 4 pages instead of 2; items without provenance
+            # count as page 1
+            if page_no is not None and page_no > 4:
                 continue
 
+            content = raw_content.strip()
+
             # Skip empty content and headers/footers, but be more lenient
             if (
                 not content
-                or text.get("label") in ["page_header", "page_footer"]
+                or label in _PAGE_FURNITURE_LABELS
                 or len(content) < 5  # Reduced from 10 to 5
             ):
                 continue
 
-            # Enhanced filtering - skip author info, metadata, and unwanted content
-            if (
-                any(
-                    indicator in content.lower()
-                    for indicator in [
-                        "correspondence:",
-                        "received:",
-                        "funding:",
-                        "doi:",
-                        "copyright",
-                        "journal of",
-                        "volume",
-                        "issue",
-                        "@",  # Email addresses
-                        "university",
-                        "institute",
-                        "department",
-                        "college",
-                        "school of",
-                        "faculty of",
-                        "laboratory",
-                        "lab ",
-                        "center for",
-                        "centre for",
-                        "hospital",
-                        "medical center",
-                        "research center",
-                        "orcid",
-                        "author",
-                        "affiliation",
-                    ]
-                )
-                or _is_author_line(content)
-                or _is_unwanted_content(content)
-            ):
+            # Skip bare page numbers first, then author info, metadata and
+            # unwanted content
+            if content.isdigit() or not _should_keep(content):
                 continue
 
-            # Skip if it's just page numbers or obvious journal info
-            if content.isdigit() or (
-                len(content) < 50
-                and any(
-                    journal in content.lower()
-                    for journal in [
-                        "phytochemical analysis",
-                        "john wiley",
-                        "doi.org",
-                        "elsevier",
-                        "springer",
-                    ]
-                )
+            # Skip journal issue information, and short lines that are just
+            # the journal or publisher name
+            lower = content.lower()
+            if _has_issue_indicator(lower) or (
+                len(content) < 50 and _has_publisher_keyword(lower)
             ):
                 continue
 
@@ -1129,29 +1531,14 @@ def extract_enhanced_paper_content(doc_json):
     # Combine and clean the text
     combined = " ".join(extracted_content)
 
-    # Remove excessive repetition (common in poorly extracted text)
-    sentences = combined.split(". ")
-    unique_sentences = []
-    seen_sentences = set()
-
-    for sentence in sentences:
-        sentence_clean = sentence.strip().lower()
-        # Skip very short sentences or ones we've already seen
-        if len(sentence_clean) > 10 and sentence_clean not in seen_sentences:
-            unique_sentences.append(sentence)
-            seen_sentences.add(sentence_clean)
+    # Remove excessive repetition (common in poorly extracted text), including
+    # near duplicates that only differ by extraction noise
+    unique_sentences = _unique_sentences(combined)
 
     combined = ". ".join(unique_sentences)
 
     # Clean up the text
-    combined = combined.replace("\n", " ")
-    combined = re.sub(r"\s+", " ", combined)
-    combined = re.sub(r"\s+([.,;:?!])", r"\1", combined)
-    combined = re.sub(r"\s*\|\s*", " | ", combined)
-    combined = re.sub(r"\s*~\s*", " ", combined)
-    combined = re.sub(r"[ŒœŸÿ]", "", combined)
-    combined = re.sub(r"(\w)-\s+(\w)", r"\1\2", combined)
-    combined = re.sub(r"\s+", " ", combined).strip()
+    combined = _clean_text(combined)
 
     return combined
 
@@ -1168,113 +1555,46 @@ def extract_full_page_text(doc_json):
 
     Returns:
         str: Concatenated and cleaned text from the first few pages.
-             Falls back to all pages if page numbers are unavailable.
+             Items without page numbers count as page 1. Falls back to later
+             pages among the first 30 elements if no early page text remains.
 
     Example:
         >>> text = extract_full_page_text(document_json)
         >>> print(len(text.split()))
         245
     """
-    # Get all text elements
-    texts = doc_json.get("texts", [])
-
-    # Filter texts from the first few pages (expanded from just page 1)
+    # Filter texts from the first few pages (expanded from just page 1). Later
+    # pages among the first 30 elements (increased from 20) are collected in
+    # the same pass as a fallback for when no early page content survives
     early_page_texts = []
-    for text in texts:
-        # Check page number from prov data
-        page_no = 1
-        if text.get("prov") and len(text.get("prov", [])) > 0:
-            page_no = text.get("prov")[0].get("page_no", 1)
-
-        # Check if this text element is on first 3 pages (expanded from just page 1)
-        if page_no <= 3:
-            content = text.get("text", "").strip()
-            if content and text.get("label") not in ["page_header", "page_footer"]:
-                # Enhanced filtering to exclude author information and unwanted content
-                if (
-                    not any(
-                        indicator in content.lower()
-                        for indicator in [
-                            "correspondence:",
-                            "received:",
-                            "funding:",
-                            "doi:",
-                            "copyright",
-                            "@",  # Email addresses
-                            "university",
-                            "institute",
-                            "department",
-                            "college",
-                            "school of",
-                            "faculty of",
-                            "laboratory",
-                            "lab ",
-                            "center for",
-                            "centre for",
-                            "hospital",
-                            "medical center",
-                            "research center",
-                            "orcid",
-                            "author",
-                            "affiliation",
-                        ]
-                    )
-                    and not _is_author_line(content)
-                    and not _is_unwanted_content(content)
-                ):
-                    early_page_texts.append(content)
+    fallback_texts = []
+    for index, (label, raw_content, page_no, _) in enumerate(iter_texts(doc_json)):
+        # Check if this text element is on first 3 pages (expanded from just page 1);
+        # items without provenance count as page 1
+        is_early_page = page_no is None or page_no <= 3
+        # Later pages can only feed the fallback, so skip them cheaply once it
+        # is no longer needed
+        if not is_early_page and (index >= 30 or early_page_texts):
+            continue
 
-    # Enhanced fallback if there's no early page content
-    if not early_page_texts and texts:
-        # Take first reasonable number of text elements as fallback
-        for i, text in enumerate(texts[:30]):  # Increased from 20 to 30 elements
-            content = text.get("text", "").strip()
-            if content and text.get("label") not in ["page_header", "page_footer"]:
-                # Enhanced filtering to exclude author information and unwanted content
-                if (
-                    not any(
-                        indicator in content.lower()
-                        for indicator in [
-                            "correspondence:",
-                            "received:",
-                            "funding:",
-                            "doi:",
-                            "copyright",
-                            "@",  # Email addresses
-                            "university",
-                            "institute",
-                            "department",
-                            "college",
-                            "school of",
-                            "faculty of",
-                            "laboratory",
-                            "lab ",
-                            "center for",
-                            "centre for",
-                            "hospital",
-                            "medical center",
-                            "research center",
-                            "orcid",
-                            "author",
-                            "affiliation",
-                        ]
-                    )
-                    and not _is_author_line(content)
-                    and not _is_unwanted_content(content)
-                ):
+        content = raw_content.strip()
+        if content and label not in _PAGE_FURNITURE_LABELS:
+            # Enhanced filtering to exclude author information and unwanted content
+            if _should_keep(content):
+                if is_early_page:
                     early_page_texts.append(content)
+                else:
+                    fallback_texts.append(content)
+
+    # Enhanced fallback if there's no early page content. Early page elements
+    # among the first 30 were already rejected, so only later pages remain
+    if not early_page_texts:
+        early_page_texts = fallback_texts
 
     # Join all text elements with spaces
     full_text = " ".join(early_page_texts)
 
     # Clean up the text similar to combine_to_paragraph function
-    full_text = full_text.replace("\n", " ")
-    full_text = re.sub(r"\s+", " ", full_text)
-    full_text = re.sub(r"\s+([.,;:?!])", r"\1", full_text)
-    full_text = re.sub(r"\s*\|\s*", " | ", full_text)
-    full_text = re.sub(r"\s*~\s*", " ", full_text)
-    full_text = re.sub(r"[ŒœŸÿ]", "", full_text)
-    full_text = re.sub(r"(\w)-\s+(\w)", r"\1\2", full_text)
-    full_text = re.sub(r"\s+", " ", full_text).strip()
+    full_text = _clean_text(full_text)
 
     return full_text
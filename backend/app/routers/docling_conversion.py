@@ -1,8 +1,8 @@
 from __future__ import annotations
+import asyncio
 import os
 import uuid
 import logging
-from PyPDF2 import PdfReader
 from fastapi import (
     APIRouter,
     HTTPException,
@@ -18,6 +18,8 @@ from app.modules.dockling_wrapper import (
     get_converted_document,
     extract_from_docling_document,
     combine_to_paragraph,
+    extract_first_pages_pymupdf,
+    save_upload_file,
 )
 from app.security.file_validator import validate_pdf_upload
 
@@ -107,14 +109,14 @@ async def extract_pdf_json(
         file_path = os.path.join(PDF_DIR, safe_filename)
 
         # Save the uploaded file
-        with open(file_path, "wb") as buffer:
-            content = await pdf_file.read()
-            buffer.write(content)
+        await save_upload_file(pdf_file, file_path)
 
         logger.info(f"File saved successfully: {safe_filename}")
 
-        # Process the PDF file
-        json_data = get_converted_document(file_path, number_of_pages=pages)
+        # Process the PDF file off the event loop
+        json_data = await asyncio.to_thread(
+            get_converted_document, file_path, number_of_pages=pages
+        )
 
         # Keep the file for future reference
         # (you can implement a cleanup strategy if needed)
@@ -128,6 +130,22 @@ async def extract_pdf_json(
         )
 
 
+def _convert_to_paragraph(file_path: str, pages: int) -> str:
+    """
+    Convert a PDF with Docling and combine its paper content into a paragraph.
+
+    Args:
+        file_path: Path to the PDF file
+        pages: Number of pages to process
+
+    Returns:
+        str: The combined text
+    """
+    json_data = get_converted_document(file_path, number_of_pages=pages, as_dict=False)
+    result = extract_from_docling_document(json_data)
+    return combine_to_paragraph(result)
+
+
 @router.post(
     "/extract_text",
     summary="Extract combined text from PDF",
@@ -168,22 +186,19 @@ async def extract_pdf_text(
             pass
         else:
             # Save the uploaded file with original name
-            with open(file_path, "wb") as buffer:
-                content = await pdf_file.read()
-                buffer.write(content)
+            await save_upload_file(pdf_file, file_path)
 
-        # Process the PDF file
-        json_data = get_converted_document(file_path, number_of_pages=pages)
-        result = extract_from_docling_document(json_data)
-        combined_text = combine_to_paragraph(result)
+        # Convert and extract in a worker thread; both are CPU-bound and would
+        # otherwise block the event loop for every other request
+        combined_text = await asyncio.to_thread(_convert_to_paragraph, file_path, pages)
 
         # Check if the extracted text has more than 10 words
         word_count = len(combined_text.split())
         if word_count <= 10:
-            reader = PdfReader(file_path)
-            if len(reader.pages) > 0:
-                first_page_text = reader.pages[0].extract_text()
-                combined_text = first_page_text.strip()
+            # Fall back to the raw text of the first page
+            combined_text = await asyncio.to_thread(
+                extract_first_pages_pymupdf, file_path, 1
+            )
 
         return {"text": combined_text, "pdf_filename": safe_filename}
 
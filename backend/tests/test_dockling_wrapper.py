@@ -0,0 +1,330 @@
+"""
+Unit tests for the Docling wrapper's caching and text-processing helpers.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import Mock
+
+import fitz
+import pytest
+
+from app.modules import dockling_wrapper
+
+
+def test_get_converter_builds_once_across_threads(monkeypatch):
+    """Concurrent first requests share a single converter."""
+
+    def build_converter():
+        time.sleep(0.05)
+        return object()
+
+    build = Mock(side_effect=build_converter)
+    monkeypatch.setattr(dockling_wrapper, "_converter", None)
+    monkeypatch.setattr(dockling_wrapper, "_build_converter", build)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        converters = list(
+            executor.map(lambda _: dockling_wrapper._get_converter(), range(8))
+        )
+
+    assert build.call_count == 1
+    assert all(converter is converters[0] for converter in converters)
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    """Point the conversion cache at tmp_path and replace Docling with a mock."""
+    document = Mock()
+    document.model_dump_json.return_value = json.dumps(
+        {"texts": [{"label": "title", "text": "Cached title"}]}
+    )
+    document.export_to_dict.return_value = {
+        "texts": [{"label": "title", "text": "Cached title"}]
+    }
+    mock_converter = Mock()
+    mock_converter.convert.return_value = Mock(document=document)
+
+    monkeypatch.setattr(dockling_wrapper, "DOCLING_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(dockling_wrapper, "extract_first_pages_stream", Mock())
+    monkeypatch.setattr(dockling_wrapper, "_get_converter", lambda: mock_converter)
+    dockling_wrapper._read_cached_document.cache_clear()
+    yield mock_converter
+    dockling_wrapper._read_cached_document.cache_clear()
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """A real three-page PDF with the page number written on each page."""
+    path = tmp_path / "sample.pdf"
+    with fitz.open() as pdf_document:
+        for page_no in range(1, 4):
+            pdf_document.new_page().insert_text((72, 72), f"Page {page_no}")
+        pdf_document.save(str(path))
+    return path
+
+
+def _page_texts(pdf_bytes):
+    """Text of each page of an in-memory PDF."""
+    with fitz.open("pdf", pdf_bytes) as pdf_document:
+        return [page.get_text("text").strip() for page in pdf_document]
+
+
+@pytest.mark.parametrize(
+    "number_of_pages, expected",
+    [(1, ["Page 1"]), (2, ["Page 1", "Page 2"]), (5, ["Page 1", "Page 2", "Page 3"])],
+)
+def test_write_first_pages(sample_pdf, number_of_pages, expected):
+    """Only the leading pages are copied, capped at the document length."""
+    buffer = BytesIO()
+
+    dockling_wrapper._write_first_pages(str(sample_pdf), number_of_pages, buffer)
+
+    assert _page_texts(buffer.getvalue()) == expected
+
+
+def test_extract_first_three_pages_writes_out_file(sample_pdf):
+    """The leading pages are saved next to the source as <name>_out.pdf."""
+    output_path = dockling_wrapper.extract_first_three_pages(str(sample_pdf), 2)
+
+    assert output_path == str(sample_pdf.with_name("sample_out.pdf"))
+    with open(output_path, "rb") as output_file:
+        assert _page_texts(output_file.read()) == ["Page 1", "Page 2"]
+
+
+def test_converted_document_cache_hit_skips_converter(tmp_path, converter):
+    """A second call with the same PDF content is served from the cache."""
+    first_pdf = tmp_path / "first.pdf"
+    second_pdf = tmp_path / "second.pdf"
+    first_pdf.write_bytes(b"%PDF-1.4 same content")
+    second_pdf.write_bytes(b"%PDF-1.4 same content")
+
+    first = dockling_wrapper.get_converted_document(str(first_pdf))
+    second = dockling_wrapper.get_converted_document(str(second_pdf))
+
+    assert converter.convert.call_count == 1
+    assert second == first
+    # No temporary files are left next to the cache entry
+    assert [p.suffix for p in tmp_path.iterdir()].count(".tmp") == 0
+
+
+def test_cached_document_is_not_shared_between_calls(tmp_path, converter):
+    """Mutating a cached result does not leak into later calls."""
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 content")
+    dockling_wrapper.get_converted_document(str(pdf))
+
+    cached = dockling_wrapper.get_converted_document(str(pdf))
+    cached["texts"].clear()
+
+    assert dockling_wrapper.get_converted_document(str(pdf))["texts"]
+
+
+def test_failed_cache_write_removes_tmp_file(tmp_path, converter):
+    """A conversion that cannot be serialized leaves no partial cache files."""
+    document = converter.convert.return_value.document
+    document.model_dump_json.side_effect = ValueError("not serializable")
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 content")
+
+    with pytest.raises(ValueError):
+        dockling_wrapper.get_converted_document(str(pdf))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["paper.pdf"]
+
+
+def test_unique_sentences_collapses_repeats_and_keeps_distinct():
+    """Pin which sentences are dropped as (near-)duplicates and which are kept."""
+    residue = (
+        "The crude methanolic extract of the aerial parts was partitioned between "
+        "water and ethyl acetate and the organic layer was concentrated under "
+        "reduced pressure to give a dark green residue"
+    )
+    # Long sentences whose fingerprints are within _SIMHASH_MAX_DISTANCE bits of
+    # each other, but whose findings differ
+    activity = (
+        "The ethyl acetate extract of the leaves showed significant activity "
+        "against Staphylococcus aureus and Escherichia coli in the broth "
+        "microdilution assay, and the minimum inhibitory concentration was "
+        "determined after incubation at 37 C for 24 h using resazurin as the "
+        "indicator of cell viability in all experiments"
+    )
+    inhibition = (
+        "Compound 3 inhibited nitric oxide production in LPS-stimulated RAW 264.7 "
+        "macrophages in a concentration dependent manner, and its effect on cell "
+        "viability was evaluated with the MTT assay after treatment for 24 h with "
+        "dexamethasone used as the positive control in all experiments"
+    )
+    distinct = [
+        activity,
+        activity.replace("showed significant", "showed no significant"),
+        activity.replace("was determined", "was not determined"),
+        activity.replace("Staphylococcus", "Bacillus"),
+        activity.replace("24 h", "48 h"),
+        inhibition,
+        inhibition.replace("Compound 3", "Compound 9"),
+    ]
+    sentences = [
+        "Compound 1 was isolated from the ethyl acetate extract of the leaves",
+        # Only case and whitespace differ
+        "compound 1 was  isolated from the Ethyl acetate extract of the leaves",
+        "Compound 2 was isolated from the ethyl acetate extract of the leaves",
+        "Compound 1 was isolated from the ethyl acetate extract of the roots",
+        "Quercetin inhibits the enzyme tyrosinase",
+        # Same words in a different order
+        "Tyrosinase inhibits the enzyme quercetin",
+        residue,
+        # Extraction noise: punctuation, a split word and a dropped article
+        residue.replace("dark green", "dark-green") + " ,",
+        residue.replace(" a dark", " dark"),
+        *distinct,
+        "Too short",
+    ]
+
+    kept = dockling_wrapper._unique_sentences(". ".join(sentences))
+
+    assert kept == [
+        "Compound 1 was isolated from the ethyl acetate extract of the leaves",
+        "Compound 2 was isolated from the ethyl acetate extract of the leaves",
+        "Compound 1 was isolated from the ethyl acetate extract of the roots",
+        "Quercetin inhibits the enzyme tyrosinase",
+        "Tyrosinase inhibits the enzyme quercetin",
+        residue,
+        *distinct,
+    ]
+
+
+def test_simhash_is_order_sensitive_and_stable():
+    """Fingerprints depend on word order and not on the process hash seed."""
+    words = "quercetin inhibits the enzyme tyrosinase".split()
+
+    assert dockling_wrapper._simhash(words) == dockling_wrapper._simhash(list(words))
+    assert dockling_wrapper._simhash(words) != dockling_wrapper._simhash(words[::-1])
+
+
+@pytest.mark.parametrize(
+    "data", [{"texts": []}, {"schema_name": "OtherDocument", "texts": []}]
+)
+def test_extract_from_docling_document_rejects_other_formats(data):
+    """Only Docling documents are accepted."""
+    assert dockling_wrapper.extract_from_docling_document(data) == {
+        "error": "Not a valid Docling document format"
+    }
+
+
+def test_extract_from_docling_document_reads_docling_dict():
+    """Exported Docling documents are identified by their schema name."""
+    data = {
+        "schema_name": "DoclingDocument",
+        "texts": [
+            {
+                "label": "section_header",
+                "text": "Anti-inflammatory constituents of the leaves",
+                "prov": [{"page_no": 1}],
+            }
+        ],
+    }
+
+    result = dockling_wrapper.extract_from_docling_document(data)
+
+    assert result["title"] == "Anti-inflammatory constituents of the leaves"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("word œ .", "word."),
+        ("Œ extracted  text\n\twith   gaps", "extracted text with gaps"),
+        ("yields , purity ; and ratio :", "yields, purity; and ratio:"),
+        ("the extrac- tion of leaves", "the extraction of leaves"),
+    ],
+)
+def test_clean_text(raw, expected):
+    """OCR artifacts, whitespace, punctuation spacing and line-break hyphens."""
+    assert dockling_wrapper._clean_text(raw) == expected
+
+
+def test_combine_to_paragraph_keeps_short_mixed_case_and_splits_glued_words():
+    """Only tokens long enough to be glued words are split at case changes."""
+    paragraph = dockling_wrapper.combine_to_paragraph(
+        {
+            "title": "Effect of pH on NaCl solubility",
+            "abstract": "The solubilityOfSodiumChlorideWasMeasured at pH 7.",
+            "main_text": "",
+        }
+    )
+
+    assert paragraph == (
+        "Effect of pH on NaCl solubility The solubility Of Sodium Chloride "
+        "Was Measured at pH 7."
+    )
+
+
+def test_combine_to_paragraph_rejects_non_dict():
+    """Invalid input returns an error message instead of raising."""
+    assert dockling_wrapper.combine_to_paragraph("text").startswith("Error")
+
+
+def _pad(text, length):
+    """Pad text with filler characters to exactly length characters."""
+    return text.ljust(length, "x")
+
+
+def test_is_author_line_ignores_prose_length_nodes():
+    """Nodes longer than _PROSE_MIN_LENGTH are never author lines."""
+    affiliation = "Department of Chemistry, University of Oxford, United Kingdom "
+    limit = dockling_wrapper._PROSE_MIN_LENGTH
+
+    assert dockling_wrapper._is_author_line(_pad(affiliation, limit))
+    assert not dockling_wrapper._is_author_line(_pad(affiliation, limit + 1))
+
+
+def test_is_unwanted_content_at_prose_length():
+    """The prose cut-off does not exempt tables, and does not flag plain prose."""
+    limit = dockling_wrapper._PROSE_MIN_LENGTH
+    caption = "Table 1. Yields of compounds "
+    prose = "The extract was partitioned between water and ethyl acetate " * 9
+
+    for length in (limit, limit + 1):
+        assert dockling_wrapper._is_unwanted_content(_pad(caption, length))
+        assert not dockling_wrapper._is_unwanted_content(prose[:length])
+        assert not dockling_wrapper._is_author_line(prose[:length])
+
+
+def test_full_page_text_keeps_items_without_page_after_later_pages():
+    """Items without provenance count as page 1 wherever they appear."""
+    doc = {
+        "texts": [
+            {
+                "label": "text",
+                "text": "the extract was dried",
+                "prov": [{"page_no": 1}],
+            },
+            {"label": "text", "text": "yields are listed", "prov": [{"page_no": 5}]},
+            {"label": "text", "text": "the residue was weighed"},
+        ]
+    }
+
+    text = dockling_wrapper.extract_full_page_text(doc)
+
+    assert text == "the extract was dried the residue was weighed"
+
+
+async def test_save_upload_file_writes_all_chunks(tmp_path, monkeypatch):
+    """Uploads larger than one chunk are written to disk in full."""
+    monkeypatch.setattr(dockling_wrapper, "_UPLOAD_CHUNK_SIZE", 4)
+    content = b"%PDF-1.4 uploaded content"
+    upload = Mock()
+    chunks = iter([content[i : i + 4] for i in range(0, len(content), 4)] + [b""])
+
+    async def read(size):
+        return next(chunks)
+
+    upload.read = read
+    destination = tmp_path / "upload.pdf"
+
+    await dockling_wrapper.save_upload_file(upload, str(destination))
+
+    assert destination.read_bytes() == content